@@ -6,10 +6,8 @@ Automated pipeline: PowerPoint PNG slides + narration script → narrated video.
 
 Workflow:
   1. Parse narration script (script.txt) → per-slide text
-  2. Generate MP3 audio for each slide via text-to-speech API
-  3. Create MP4 video per slide (PNG image + audio) via ffmpeg
-  4. Concatenate slide videos → single output
-  5. Apply professional fade-in / fade-out
+  2. Generate MP3 audio for each slide via text-to-speech API (parallel)
+  3. Single ffmpeg pass: scale/pad each slide, concat, fade-in/out → final MP4
 
 Requirements:
   pip install -r requirements.txt
@@ -27,15 +25,18 @@ Author: Setegn Worku Alemu, PhD | ILRI / CGIAR
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
 import os
-import re
+import random
 import shutil
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Iterator
+from typing import AsyncIterator
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -69,25 +70,55 @@ AUDIO_BITRATE: str = "192k"     # AAC audio bitrate in final video
 SILENCE_PADDING: float = 0.5   # Seconds of silence appended to each slide's audio
 FADE_DURATION: float   = 0.5   # Seconds for fade-in and fade-out on final video
 
+# ── Parallelism ───────────────────────────────────────────────────────────────
+ELEVEN_MAX_CONCURRENCY: int = 5   # In-flight TTS requests (respects rate limits)
+
 # ── API reliability ───────────────────────────────────────────────────────────
-MAX_RETRIES: int     = 3
-RETRY_BACKOFF: float = 2.0     # Initial wait (seconds); doubles on each retry
+MAX_RETRIES: int        = 3
+RETRY_BACKOFF: float    = 2.0    # Initial wait (seconds); doubles on each retry
+BREAKER_THRESHOLD: int  = 3      # Consecutive failures before pausing new requests
+BREAKER_COOLDOWN: float = 30.0   # Seconds the circuit breaker stays open
 
 # ── Behaviour flags ───────────────────────────────────────────────────────────
 SKIP_EXISTING_AUDIO: bool = True   # Reuse existing .mp3 files (saves API credits)
 CLEANUP: bool             = True   # Delete intermediate files after final video
+VERBOSE: bool             = False  # Stream ffmpeg output to the terminal
+USE_HW_ENCODER: bool      = True   # Use a GPU H.264 encoder when ffmpeg has one
 
 # ── File names ────────────────────────────────────────────────────────────────
 SCRIPT_FILENAME: str = "script.txt"
 FINAL_OUTPUT: str    = "final_video.mp4"
-_RAW_CONCAT: str     = "_raw_concat.mp4"   # temporary; deleted after fades applied
-_CONCAT_LIST: str    = "_concat_list.txt"  # temporary; deleted after concatenation
+TTS_CACHE_DIR: str   = ".cache/tts"      # content-keyed MP3 cache; survives CLEANUP
+FRAME_CACHE_DIR: str = ".cache/frames"   # pre-scaled slide images, keyed by content
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # STEP 1 — Parse narration script
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Footer tokens dropped from narration bodies (compared case-insensitively)
+_FOOTERS = frozenset({"END OF SCRIPT", "END OF NARRATION"})
+
+
+def _parse_slide_header(line: str) -> int | None:
+    """
+    Return the slide number if `line` is a "SLIDE <number> …" header
+    (case-insensitive, number ends at a word boundary), else None.
+    """
+    if line[:6].upper() != "SLIDE ":
+        return None
+    rest = line[6:].lstrip()
+    i = 0
+    while i < len(rest) and rest[i].isdigit():
+        i += 1
+    if i == 0:
+        return None
+    follower = rest[i : i + 1]
+    if follower and (follower.isalnum() or follower == "_"):
+        return None                       # e.g. "SLIDE 3a" is not a header
+    return int(rest[:i])
+
+
 def parse_script(script_path: Path) -> dict[int, str]:
     """
     Parse script.txt and return {slide_number: narration_text}.
@@ -104,48 +135,46 @@ def parse_script(script_path: Path) -> dict[int, str]:
 
     Separator lines (=====, -----), the SLIDE header line itself, and the
     "END OF SCRIPT" footer are all stripped; only narration body text is kept.
+    Runs in a single pass over the file — one line at a time, no regex, no
+    full-text slicing — so arbitrarily large scripts parse in linear time.
     """
-    text = script_path.read_text(encoding="utf-8")
-
-    # Match "SLIDE <number>" at the start of a line (case-insensitive)
-    slide_re = re.compile(r"^SLIDE\s+(\d+)\b", re.MULTILINE | re.IGNORECASE)
-    matches = list(slide_re.finditer(text))
-
-    if not matches:
-        raise ValueError(f"No SLIDE markers found in '{script_path}'")
-
     slides: dict[int, str] = {}
+    current: int | None = None
+    buf: list[str] = []
 
-    for idx, match in enumerate(matches):
-        slide_num = int(match.group(1))
-
-        # Body begins after the SLIDE header line ends
-        line_end   = text.index("\n", match.start())
-        body_start = line_end + 1
-
-        # Body ends at the start of the next SLIDE marker (or EOF)
-        body_end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
+    def flush() -> None:
+        if current is None:
+            return
+        body = "\n".join(buf).strip()
+        if not body:
+            print(f"  WARNING: Slide {current} narration is empty.")
+        slides[current] = body
+
+    with script_path.open(encoding="utf-8") as fh:
+        for line in fh:
+            slide_num = _parse_slide_header(line)
+            if slide_num is not None:
+                flush()                   # close out the previous slide's body
+                current = slide_num
+                buf = []
+                continue
 
-        raw_body = text[body_start:body_end]
+            if current is None:
+                continue                  # preamble before the first SLIDE marker
 
-        # Remove separator lines and known footer tokens
-        cleaned_lines: list[str] = []
-        for line in raw_body.splitlines():
             stripped = line.strip()
-            if re.fullmatch(r"[=\-]{3,}", stripped):
-                continue                               # separator line (===, ---)
-            if stripped.upper() in ("END OF SCRIPT", "END OF NARRATION"):
+            if len(stripped) >= 3 and set(stripped) <= {"=", "-"}:
+                continue                  # separator line (===, ---)
+            if stripped.upper() in _FOOTERS:
                 continue
-            cleaned_lines.append(stripped)
-
-        # Collapse 3+ consecutive blank lines → single blank; trim outer whitespace
-        body = "\n".join(cleaned_lines).strip()
-        body = re.sub(r"\n{3,}", "\n\n", body)
+            if not stripped and buf and not buf[-1]:
+                continue                  # collapse runs of blank lines to one
+            buf.append(stripped)
 
-        if not body:
-            print(f"  WARNING: Slide {slide_num} narration is empty.")
+    flush()
 
-        slides[slide_num] = body
+    if not slides:
+        raise ValueError(f"No SLIDE markers found in '{script_path}'")
 
     return slides
 
@@ -154,7 +183,13 @@ def parse_script(script_path: Path) -> dict[int, str]:
 # STEP 2 — Generate audio via ElevenLabs TTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def generate_audio(
+# Shared circuit breaker: after BREAKER_THRESHOLD consecutive failures across
+# all slides, new requests pause until the cooldown expires, so concurrent
+# workers stop hammering a rate-limited API in lockstep.
+_breaker = {"fails": 0, "open_until": 0.0}
+
+
+async def generate_audio(
     client: object,
     text: str,
     output_path: Path,
@@ -164,7 +199,11 @@ def generate_audio(
     """
     Convert `text` to speech and save as MP3 at `output_path`.
 
-    Uses client.text_to_speech.convert() from the current ElevenLabs SDK.
+    Uses client.text_to_speech.convert() from the async ElevenLabs SDK and
+    streams chunks to disk as they arrive off the network, so the full MP3 is
+    never buffered in memory.  Results are cached under TTS_CACHE_DIR keyed by
+    a hash of the text plus all voice parameters, so re-runs after edits to
+    unrelated slides — or after slides are renumbered — never re-bill the API.
     Retries up to MAX_RETRIES times with exponential back-off on any failure.
     """
     if SKIP_EXISTING_AUDIO and output_path.is_file() and output_path.stat().st_size > 0:
@@ -172,7 +211,6 @@ def generate_audio(
         return
 
     label = f"Slide {slide_num}/{total_slides}"
-    print(f"  Generating audio for {label}…", end="", flush=True)
 
     # Import VoiceSettings — handle both current and older SDK package layouts
     VoiceSettings = _import_voice_settings()
@@ -184,30 +222,63 @@ def generate_audio(
         use_speaker_boost=VOICE_USE_SPEAKER_BOOST,
     )
 
+    # Content-keyed cache: identical text + voice parameters → identical audio
+    cache_dir  = output_path.parent / TTS_CACHE_DIR
+    key        = _tts_cache_key(text, voice_settings)
+    cache_path = cache_dir / f"{key}.mp3"
+
+    if cache_path.is_file() and cache_path.stat().st_size > 0:
+        _link_or_copy(cache_path, output_path)
+        print(f"  {label}: cache hit ({key}) — no API call")
+        return
+
     for attempt in range(1, MAX_RETRIES + 1):
+        # Honour the shared breaker before spending an attempt on the API
+        pause = _breaker["open_until"] - time.time()
+        if pause > 0:
+            print(f"    {label}: circuit breaker open — waiting {pause:.0f}s…")
+            await asyncio.sleep(pause)
+
         try:
-            audio_stream: Iterator[bytes] = client.text_to_speech.convert(
+            audio_stream: AsyncIterator[bytes] = client.text_to_speech.convert(
                 voice_id=VOICE_ID,
                 text=text,
                 model_id=MODEL_ID,
                 output_format=OUTPUT_FORMAT,
                 voice_settings=voice_settings,
             )
-            # Collect all streamed byte chunks into a single MP3 file
-            audio_bytes = b"".join(audio_stream)
-            output_path.write_bytes(audio_bytes)
+            # Write each streamed chunk straight into the cache as it arrives;
+            # the 1 MB buffer batches the small network chunks into few writes
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with cache_path.open("wb", buffering=1024 * 1024) as fh:
+                async for chunk in audio_stream:
+                    fh.write(chunk)
+
+            _update_cache_index(cache_dir, key, slide_num, text)
+            _link_or_copy(cache_path, output_path)
+
+            _breaker["fails"] = 0
             size_kb = output_path.stat().st_size / 1024
-            print(f" done ({size_kb:.0f} KB)")
+            print(f"  {label}: audio generated ({size_kb:.0f} KB)")
             return
 
         except Exception as exc:
+            # Never leave a truncated MP3 behind — it would read as a cache hit
+            cache_path.unlink(missing_ok=True)
+
+            _breaker["fails"] += 1
+            if _breaker["fails"] >= BREAKER_THRESHOLD:
+                _breaker["open_until"] = time.time() + BREAKER_COOLDOWN
+
             if attempt < MAX_RETRIES:
-                wait = RETRY_BACKOFF * (2 ** (attempt - 1))
+                # Jitter desynchronises concurrent workers so retries after a
+                # rate-limit storm don't collide again in lockstep
+                wait = RETRY_BACKOFF * (2 ** (attempt - 1)) * (0.5 + random.random())
                 print(
-                    f"\n    Attempt {attempt} failed: {exc}. "
+                    f"    {label} attempt {attempt} failed: {exc}. "
                     f"Retrying in {wait:.0f}s…"
                 )
-                time.sleep(wait)
+                await asyncio.sleep(wait)
             else:
                 raise RuntimeError(
                     f"ElevenLabs TTS failed for Slide {slide_num} "
@@ -215,8 +286,76 @@ def generate_audio(
                 ) from exc
 
 
+async def tts_all(
+    client: object,
+    narration: dict[int, str],
+    slide_numbers: list[int],
+    work_dir: Path,
+    total_slides: int,
+) -> dict[int, Path]:
+    """
+    Generate narration audio for every slide concurrently.
+
+    All requests are launched at once, bounded by a semaphore of
+    ELEVEN_MAX_CONCURRENCY so the ElevenLabs rate limit isn't tripped.
+    Returns {slide_number: mp3_path}.
+    """
+    semaphore = asyncio.Semaphore(ELEVEN_MAX_CONCURRENCY)
+    audio_files = {n: work_dir / f"slide{n}.mp3" for n in slide_numbers}
+
+    async def one_slide(n: int) -> None:
+        async with semaphore:
+            await generate_audio(
+                client, narration[n], audio_files[n], n, total_slides
+            )
+
+    await asyncio.gather(*(one_slide(n) for n in slide_numbers))
+    return audio_files
+
+
+def _tts_cache_key(text: str, voice_settings: object) -> str:
+    """Cache key: hash of the narration text plus every voice parameter."""
+    payload = (
+        text.encode()
+        + VOICE_ID.encode()
+        + MODEL_ID.encode()
+        + repr(voice_settings).encode()
+    )
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink `src` to `dst` (free); fall back to a copy across filesystems."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _update_cache_index(cache_dir: Path, key: str, slide_num: int, text: str) -> None:
+    """Record key → slide/text preview in index.json (a debugging aid only)."""
+    index_path = cache_dir / "index.json"
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        index = {}
+    index[key] = {"slide_num": slide_num, "text_preview": text[:80]}
+    index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+
+
+_VOICE_SETTINGS_CLS: type | None = None
+
+
 def _import_voice_settings() -> type:
-    """Import VoiceSettings, tolerating different ElevenLabs SDK versions."""
+    """
+    Import VoiceSettings, tolerating different ElevenLabs SDK versions.
+    The probe runs once; every later call returns the cached class.
+    """
+    global _VOICE_SETTINGS_CLS
+    if _VOICE_SETTINGS_CLS is not None:
+        return _VOICE_SETTINGS_CLS
+
     for module_path in (
         "elevenlabs",
         "elevenlabs.types",
@@ -226,7 +365,8 @@ def _import_voice_settings() -> type:
             import importlib
             mod = importlib.import_module(module_path)
             if hasattr(mod, "VoiceSettings"):
-                return mod.VoiceSettings
+                _VOICE_SETTINGS_CLS = mod.VoiceSettings
+                return _VOICE_SETTINGS_CLS
         except ImportError:
             continue
     raise ImportError(
@@ -236,20 +376,30 @@ def _import_voice_settings() -> type:
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# STEP 3 — Create individual slide videos with ffmpeg
+# STEP 3 — Build the final video in a single ffmpeg pass
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def get_duration(path: Path) -> float:
     """
     Return the duration of any media file (audio or video) in seconds.
     Uses ffprobe with JSON output; prefers format-level duration (most reliable).
+
+    Results are memoized by (path, mtime, size), so probing the same unchanged
+    file twice costs one ffprobe fork, not two; rewriting the file invalidates
+    the entry automatically.
     """
+    st = path.stat()
+    return _get_duration_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_duration_cached(path: str, mtime_ns: int, size: int) -> float:
     cmd = [
         "ffprobe", "-v", "quiet",
         "-print_format", "json",
         "-show_format",
         "-show_streams",
-        str(path),
+        path,
     ]
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)
     data = json.loads(result.stdout)
@@ -267,137 +417,227 @@ def get_duration(path: Path) -> float:
     raise ValueError(f"Cannot determine duration for: {path}")
 
 
-def pad_audio(src: Path, dst: Path, extra_seconds: float) -> None:
+def get_audio_duration(path: Path) -> float:
     """
-    Append `extra_seconds` of silence to `src` and write the result to `dst`.
-    Creates a brief audio buffer between slides for smoother transitions.
+    Return an MP3's duration in seconds without spawning a subprocess.
+
+    mutagen reads the duration straight from the MP3 headers — pure Python,
+    ~instant — saving one ffprobe fork + JSON parse per slide.  Falls back to
+    ffprobe if mutagen is not installed.
     """
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", str(src),
-        "-af", f"apad=pad_dur={extra_seconds}",
-        "-c:a", "libmp3lame",
-        "-b:a", AUDIO_BITRATE,
-        str(dst),
-    ]
-    subprocess.run(cmd, capture_output=True, check=True)
+    try:
+        from mutagen.mp3 import MP3
+    except ImportError:
+        return get_duration(path)
+    return float(MP3(path).info.length)
 
 
-def create_slide_video(
-    image_path: Path,
-    audio_path: Path,
-    output_path: Path,
-    slide_num: int,
-) -> None:
+def _run_ffmpeg(cmd: list[str]) -> None:
+    """
+    Run an ffmpeg command, discarding its output.
+
+    ffmpeg writes kilobytes of banner/progress text to stderr; draining that
+    through Python pipes (capture_output=True) costs CPU and can stall ffmpeg
+    once the pipe buffer fills.  Every command therefore runs with
+    `-hide_banner -loglevel error -nostats` so stderr carries only real
+    errors, and output goes to /dev/null — or to the terminal at `info`
+    level when VERBOSE is set.  On failure the command is re-run once with
+    output captured so the raised error carries ffmpeg's own diagnostic.
     """
-    Combine a static PNG image and an MP3 audio file into a Full-HD MP4 segment.
+    if VERBOSE:
+        loglevel = ["-hide_banner", "-loglevel", "info"]
+    else:
+        loglevel = ["-hide_banner", "-loglevel", "error", "-nostats"]
+    cmd = cmd[:1] + loglevel + cmd[1:]
+
+    if VERBOSE:
+        subprocess.run(cmd, check=True)
+        return
+
+    try:
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except subprocess.CalledProcessError as exc:
+        # The failure is deterministic; re-run to fetch the diagnostic tail.
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        tail = "\n".join(result.stderr.splitlines()[-15:])
+        raise RuntimeError(
+            f"ffmpeg failed (exit code {exc.returncode}):\n{tail}"
+        ) from exc
+
 
-    - Image is scaled to fit 1920×1080, with black letterbox/pillarbox bars.
-    - Output duration exactly matches audio duration.
-    - Uses libx264 + AAC for maximum compatibility.
+# Hardware H.264 encoders worth probing for, in preference order
+_HW_ENCODER_NAMES = ("h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_amf")
+
+_hw_encoder: str | None = None
+_hw_encoder_probed: bool = False
+
+
+def _detect_hw_encoder() -> str | None:
     """
-    duration = get_duration(audio_path)
-    print(f"  Slide {slide_num:>2}: {duration:.2f}s  →  {output_path.name}")
+    Return the first available hardware H.264 encoder name, or None.
 
-    # Video filter chain:
-    #   scale   → fit image inside 1920×1080, preserving aspect ratio
-    #   pad     → add black bars to fill the remaining space
-    #   format  → convert to yuv420p for maximum player compatibility
-    vf = (
-        f"scale={TARGET_WIDTH}:{TARGET_HEIGHT}:force_original_aspect_ratio=decrease,"
-        f"pad={TARGET_WIDTH}:{TARGET_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black,"
-        f"format=yuv420p"
+    Still-image slides encode at hundreds of fps on NVENC/QSV/VideoToolbox
+    versus libx264 grinding through zero-motion estimation.  Runs
+    `ffmpeg -encoders` once per process; the result is cached.
+    """
+    global _hw_encoder, _hw_encoder_probed
+    if _hw_encoder_probed:
+        return _hw_encoder
+    _hw_encoder_probed = True
+
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-encoders"],
+        capture_output=True,
+        text=True,
     )
-
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1",                         # loop still image as video input
-        "-framerate", str(VIDEO_FPS),         # input frame rate for the image
-        "-i", str(image_path),                # input 1: PNG image
-        "-i", str(audio_path),                # input 2: MP3 audio
-        "-vf", vf,
+    if result.returncode == 0:
+        for name in _HW_ENCODER_NAMES:
+            if name in result.stdout:
+                _hw_encoder = name
+                break
+    return _hw_encoder
+
+
+def _video_codec_args(encoder: str | None) -> list[str]:
+    """Video-codec arguments for the final encode, per available encoder."""
+    if encoder == "h264_nvenc":
+        return [
+            "-c:v", "h264_nvenc",
+            "-preset", "p6",
+            "-tune", "hq",
+            "-rc", "vbr",
+            "-cq", str(VIDEO_CRF),
+            "-b:v", "0",
+        ]
+    if encoder == "h264_qsv":
+        return ["-c:v", "h264_qsv", "-preset", "slower", "-global_quality", str(VIDEO_CRF)]
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", "h264_videotoolbox", "-q:v", "65"]
+    if encoder == "h264_amf":
+        return [
+            "-c:v", "h264_amf",
+            "-quality", "quality",
+            "-rc", "cqp",
+            "-qp_i", str(VIDEO_CRF),
+            "-qp_p", str(VIDEO_CRF),
+        ]
+    # Software fallback — stillimage tuning suits a slide deck
+    return [
         "-c:v", "libx264",
         "-preset", VIDEO_PRESET,
         "-crf", str(VIDEO_CRF),
-        "-r", str(VIDEO_FPS),                 # explicit output frame rate
-        "-c:a", "aac",
-        "-b:a", AUDIO_BITRATE,
-        "-t", f"{duration:.6f}",              # limit output to exact audio duration
-        "-shortest",                          # safety: stop at shortest stream
-        "-movflags", "+faststart",            # optimise MP4 atom placement for web
-        str(output_path),
+        "-tune", "stillimage",
     ]
-    subprocess.run(cmd, capture_output=True, check=True)
 
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# STEP 4 — Concatenate slide videos
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def concatenate_videos(video_paths: list[Path], output_path: Path) -> None:
-    """
-    Concatenate MP4 segments using the ffmpeg concat demuxer (stream copy, fast).
-    All segments must share identical codec, resolution, and sample-rate settings,
-    which is guaranteed because they were all created by create_slide_video().
+def _prescale_image(image_path: Path, cache_dir: Path) -> Path:
     """
-    concat_list = output_path.parent / _CONCAT_LIST
+    Scale/pad `image_path` to TARGET_WIDTH×TARGET_HEIGHT once and cache the
+    result, keyed by the image bytes and the target geometry.
 
-    with concat_list.open("w", encoding="utf-8") as fh:
-        for vp in video_paths:
-            # Absolute path with forward slashes; no single quotes in our paths
-            path_str = str(vp.resolve()).replace("\\", "/")
-            fh.write(f"file '{path_str}'\n")
+    With -loop 1 the scale/pad filters would otherwise run on every duplicated
+    frame — VIDEO_FPS times per second for the slide's whole duration.  This
+    does that work exactly once per unique image (slides sharing a template
+    share a cache entry), leaving only a cheap format conversion per frame.
+    """
+    digest = hashlib.sha1(image_path.read_bytes()).hexdigest()[:16]
+    cached = cache_dir / f"{digest}_{TARGET_WIDTH}x{TARGET_HEIGHT}.png"
+    if cached.is_file() and cached.stat().st_size > 0:
+        return cached
 
-    cmd = [
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    vf = (
+        f"scale={TARGET_WIDTH}:{TARGET_HEIGHT}:force_original_aspect_ratio=decrease,"
+        f"pad={TARGET_WIDTH}:{TARGET_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black"
+    )
+    _run_ffmpeg([
         "ffmpeg", "-y",
-        "-f", "concat",
-        "-safe", "0",           # allow absolute paths in the concat list
-        "-i", str(concat_list),
-        "-c", "copy",           # stream copy — no re-encode; preserves quality
-        str(output_path),
-    ]
-    subprocess.run(cmd, capture_output=True, check=True)
-
-    concat_list.unlink(missing_ok=True)
-
+        "-i", str(image_path),
+        "-vf", vf,
+        "-frames:v", "1",
+        str(cached),
+    ])
+    return cached
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# STEP 5 — Apply professional fade-in / fade-out
-# ═══════════════════════════════════════════════════════════════════════════════
 
-def apply_fades(input_path: Path, output_path: Path) -> None:
+def build_final_video(
+    slide_images: dict[int, Path],
+    audio_files: dict[int, Path],
+    slide_numbers: list[int],
+    output_path: Path,
+) -> None:
     """
-    Re-encode the concatenated video adding:
-      - Fade-in  from black at the very start  (FADE_DURATION seconds)
-      - Fade-out to   black at the very end    (FADE_DURATION seconds)
-    Both video and audio tracks are faded.
+    Build the complete narrated video in a single ffmpeg invocation.
+
+    Each slide image is first pre-scaled/padded to 1920×1080 once (cached —
+    see _prescale_image).  The filter graph then, per slide, converts the
+    still to yuv420p and appends SILENCE_PADDING seconds of silence to the
+    narration (apad), joins all segments with the concat filter, and chains
+    the fade-in/fade-out onto the joined streams.  One video encode total —
+    no per-slide MP4s, no concat pass, no separate fade re-encode.
     """
-    total_dur      = get_duration(input_path)
+    n_slides = len(slide_numbers)
+    cmd: list[str] = ["ffmpeg", "-y"]
+    durations: dict[int, float] = {}
+
+    # Inputs: per slide, the looped still image (2i) then its narration (2i+1).
+    # Each image input is bounded to the padded audio length via -t.
+    frame_cache = output_path.parent / FRAME_CACHE_DIR
+    for n in slide_numbers:
+        durations[n] = get_audio_duration(audio_files[n]) + SILENCE_PADDING
+        print(f"  Slide {n:>2}: {durations[n]:.2f}s")
+        cmd += [
+            "-loop", "1",
+            "-framerate", str(VIDEO_FPS),
+            "-t", f"{durations[n]:.6f}",
+            "-i", str(_prescale_image(slide_images[n], frame_cache)),
+            "-i", str(audio_files[n]),
+        ]
+
+    total_dur      = sum(durations.values())
     fade_out_start = max(0.0, total_dur - FADE_DURATION)
 
-    vf = (
-        f"fade=t=in:st=0:d={FADE_DURATION:.3f},"
-        f"fade=t=out:st={fade_out_start:.3f}:d={FADE_DURATION:.3f}"
+    # Filter graph: convert each pre-scaled still, pad each narration,
+    # concat, fade.  Scaling/padding already happened once per unique image.
+    filters: list[str] = []
+    for i in range(n_slides):
+        filters.append(f"[{2 * i}:v]format=yuv420p,setsar=1[v{i}]")
+        filters.append(f"[{2 * i + 1}:a]apad=pad_dur={SILENCE_PADDING}[a{i}]")
+
+    pairs = "".join(f"[v{i}][a{i}]" for i in range(n_slides))
+    filters.append(f"{pairs}concat=n={n_slides}:v=1:a=1[vcat][acat]")
+    filters.append(
+        f"[vcat]fade=t=in:st=0:d={FADE_DURATION:.3f},"
+        f"fade=t=out:st={fade_out_start:.3f}:d={FADE_DURATION:.3f}[vout]"
     )
-    af = (
-        f"afade=t=in:st=0:d={FADE_DURATION:.3f},"
-        f"afade=t=out:st={fade_out_start:.3f}:d={FADE_DURATION:.3f}"
+    filters.append(
+        f"[acat]afade=t=in:st=0:d={FADE_DURATION:.3f},"
+        f"afade=t=out:st={fade_out_start:.3f}:d={FADE_DURATION:.3f}[aout]"
     )
 
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", str(input_path),
-        "-vf", vf,
-        "-af", af,
-        "-c:v", "libx264",
-        "-preset", VIDEO_PRESET,
-        "-crf", str(VIDEO_CRF),
+    encoder = _detect_hw_encoder() if USE_HW_ENCODER else None
+    cmd += [
+        "-filter_complex", ";".join(filters),
+        "-map", "[vout]",
+        "-map", "[aout]",
+        *_video_codec_args(encoder),
+        "-r", str(VIDEO_FPS),
         "-c:a", "aac",
         "-b:a", AUDIO_BITRATE,
-        "-movflags", "+faststart",
+        "-movflags", "+faststart",            # optimise MP4 atom placement for web
         str(output_path),
     ]
-    subprocess.run(cmd, capture_output=True, check=True)
+
+    print(
+        f"  Encoding {n_slides} slide(s), {seconds_to_hms(total_dur)} total "
+        f"({encoder or 'libx264'}) …"
+    )
+    _run_ffmpeg(cmd)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -425,13 +665,20 @@ def find_slide_images(work_dir: Path) -> dict[int, Path]:
     Scan `work_dir` for PNG files whose names match slide<N>.png
     (case-insensitive, e.g. Slide1.PNG, slide12.png).
     Returns a sorted dict: {slide_number: Path}.
+
+    Uses os.scandir with plain string tests: the directory also holds the
+    narration MP3s, the cache, and the final video, so a cheap prefix/suffix
+    reject per entry beats running a regex on every name.
     """
-    pattern = re.compile(r"^slide(\d+)\.png$", re.IGNORECASE)
     images: dict[int, Path] = {}
-    for f in work_dir.iterdir():
-        m = pattern.match(f.name)
-        if m:
-            images[int(m.group(1))] = f
+    with os.scandir(work_dir) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if not (name.startswith("slide") and name.endswith(".png")):
+                continue
+            num = name[5:-4]
+            if num.isdigit():
+                images[int(num)] = Path(entry.path)
     return dict(sorted(images.items()))
 
 
@@ -475,18 +722,18 @@ def main() -> None:
         )
 
     try:
-        from elevenlabs import ElevenLabs
+        from elevenlabs import AsyncElevenLabs
     except ImportError:
         sys.exit(
             "ERROR: ElevenLabs SDK not installed.\n"
             "       Run:  pip install elevenlabs"
         )
 
-    client = ElevenLabs(api_key=ELEVENLABS_API_KEY)
+    client = AsyncElevenLabs(api_key=ELEVENLABS_API_KEY)
     work_dir = Path(__file__).parent.resolve()
 
     # ── Step 1: Locate files and parse script ─────────────────────────────────
-    print("\n[1/5] Locating files and parsing narration script …")
+    print("\n[1/3] Locating files and parsing narration script …")
 
     script_path = find_script_file(work_dir)
     print(f"      Script   : {script_path}")
@@ -523,48 +770,23 @@ def main() -> None:
     # Only process slides that have both image and narration
     slide_numbers = sorted(set(slide_images) & set(narration))
 
-    # ── Step 2: Generate audio ────────────────────────────────────────────────
-    print(f"\n[2/5] Generating narration audio via ElevenLabs …")
-
-    audio_files: dict[int, Path] = {}
-    for n in slide_numbers:
-        mp3_path = work_dir / f"slide{n}.mp3"
-        generate_audio(client, narration[n], mp3_path, n, total_slides)
-        audio_files[n] = mp3_path
-
-    # ── Step 3: Pad audio and build slide video segments ──────────────────────
-    print(f"\n[3/5] Building {total_slides} slide video segment(s) …")
-
-    padded_files: list[Path] = []
-    slide_videos:  list[Path] = []
-
-    for n in slide_numbers:
-        raw_mp3    = audio_files[n]
-        padded_mp3 = work_dir / f"slide{n}_padded.mp3"
-        slide_mp4  = work_dir / f"slide{n}.mp4"
-
-        # Append 0.5s of silence so adjacent slides don't feel abrupt
-        pad_audio(raw_mp3, padded_mp3, SILENCE_PADDING)
-        padded_files.append(padded_mp3)
-
-        create_slide_video(slide_images[n], padded_mp3, slide_mp4, n)
-        slide_videos.append(slide_mp4)
-
-    # ── Step 4: Concatenate all slide videos ──────────────────────────────────
-    print(f"\n[4/5] Concatenating {total_slides} segments …")
-
-    raw_concat = work_dir / _RAW_CONCAT
-    concatenate_videos(slide_videos, raw_concat)
+    # ── Step 2: Generate audio (concurrently) ─────────────────────────────────
+    # All TTS requests run in flight at once on one event loop; the semaphore
+    # in tts_all() keeps us under the ElevenLabs rate limit.
+    print(
+        f"\n[2/3] Generating narration audio via ElevenLabs "
+        f"(up to {ELEVEN_MAX_CONCURRENCY} concurrent request(s)) …"
+    )
 
-    raw_concat_dur = get_duration(raw_concat)
-    print(f"      Raw concat: {seconds_to_hms(raw_concat_dur)}  ({raw_concat_dur:.1f}s)")
+    audio_files = asyncio.run(
+        tts_all(client, narration, slide_numbers, work_dir, total_slides)
+    )
 
-    # ── Step 5: Apply fade-in / fade-out ─────────────────────────────────────
-    print(f"\n[5/5] Applying {FADE_DURATION}s fade-in / fade-out …")
+    # ── Step 3: Build the final video in one ffmpeg pass ──────────────────────
+    print(f"\n[3/3] Building final video (single ffmpeg pass, with fades) …")
 
     final_output = work_dir / FINAL_OUTPUT
-    apply_fades(raw_concat, final_output)
-    raw_concat.unlink(missing_ok=True)
+    build_final_video(slide_images, audio_files, slide_numbers, final_output)
 
     # ── Summary ───────────────────────────────────────────────────────────────
     total_dur = get_duration(final_output)
@@ -579,11 +801,7 @@ def main() -> None:
     # ── Cleanup intermediate files ────────────────────────────────────────────
     if CLEANUP:
         print("\nCleaning up intermediate files …")
-        to_delete = (
-            list(audio_files.values())  # slide1.mp3 … slide12.mp3
-            + padded_files              # slide1_padded.mp3 …
-            + slide_videos              # slide1.mp4 …
-        )
+        to_delete = list(audio_files.values())  # slide1.mp3 … slide12.mp3
         for f in to_delete:
             if f.exists():
                 f.unlink()